@@ -0,0 +1,157 @@
+import io
+from datetime import date
+
+from vcard import parse_date, read_cards
+from vcf2exchangeCSV import CSV_HEADERS, FN_BUSINESS, FN_LAST, FN_MOBILE, convert
+
+
+def cards(*lines):
+    return list(read_cards(io.StringIO("\r\n".join(lines) + "\r\n")))
+
+
+def card(*lines):
+    (result,) = cards("BEGIN:VCARD", "VERSION:3.0", *lines, "END:VCARD")
+    return result
+
+
+def test_folded_lines_are_joined():
+    c = card(
+        "NOTE:first part",
+        "  second part",
+        "\tthird",
+    )
+    assert c["note"] == "first part second partthird"
+
+
+def test_multiple_cards_and_unrelated_lines():
+    result = cards(
+        "BEGIN:VCARD",
+        "N:One;A;;;",
+        "END:VCARD",
+        "stray line outside a card",
+        "BEGIN:VCARD",
+        "N:Two;B;;;",
+        "FN:B Two",
+        "END:VCARD",
+    )
+    assert [c["n"][0] for c in result] == ["One", "Two"]
+
+
+def test_quoted_printable_is_decoded():
+    c = card(
+        "N;CHARSET=UTF-8;ENCODING=QUOTED-PRINTABLE:M=C3=BCller;J=C3=BCrgen;;;",
+        "TITLE;ENCODING=QUOTED-PRINTABLE;CHARSET=ISO-8859-1:Gesch=E4ftsf=FChrer",
+    )
+    assert c["n"][:2] == ["Müller", "Jürgen"]
+    assert c["title"] == "Geschäftsführer"
+
+
+def test_quoted_printable_soft_line_breaks_are_joined():
+    c = card(
+        "NOTE;ENCODING=QUOTED-PRINTABLE;CHARSET=UTF-8:first line=0D=0A=",
+        "second line with =C3=",
+        "=BC",
+        "TEL;CELL:0170",
+    )
+    assert c["note"] == "first line\r\nsecond line with ü"
+    assert c["tel"] == [({"TYPE": ["CELL"]}, "0170")]
+
+
+def test_trailing_equals_outside_quoted_printable_is_kept():
+    c = card("NOTE:a=", "TITLE:b")
+    assert c["note"] == "a="
+    assert c["title"] == "b"
+
+
+def test_leading_bom_is_ignored():
+    result = list(read_cards(io.StringIO("\ufeffBEGIN:VCARD\nN:One;A\nEND:VCARD\n")))
+    assert [c["n"][0] for c in result] == ["One"]
+
+
+def test_bom_file_keeps_first_card_in_csv(tmp_path):
+    vcf = tmp_path / "in.vcf"
+    vcf.write_text(
+        "BEGIN:VCARD\nN:One;A\nEND:VCARD\nBEGIN:VCARD\nN:Two;B\nEND:VCARD\n",
+        encoding="utf-8-sig",
+    )
+    out = tmp_path / "out.csv"
+    convert(vcf, out)
+
+    rows = out.read_text(encoding="utf-8-sig").splitlines()[1:]
+    assert [r.split('","')[FN_LAST] for r in rows] == ["One", "Two"]
+
+
+def test_text_escapes():
+    c = card(r"TITLE:Chief\, Engineer\; Ops", r"NOTE:a\nb\Nc\\d")
+    assert c["title"] == "Chief, Engineer; Ops"
+    assert c["note"] == "a\nb\nc\\d"
+
+
+def test_structured_escapes():
+    c = card(r"N:Back\\;John;;;", r"ORG:Acme\; Co\, Ltd;R&D")
+    assert c["n"][:2] == ["Back\\", "John"]
+    assert c["org"] == ["Acme; Co, Ltd", "R&D"]
+
+
+def test_short_n_is_padded():
+    assert card("N:Doe")["n"] == ["Doe", "", "", "", ""]
+    assert card("N:Doe;Jane")["n"] == ["Doe", "Jane", "", "", ""]
+
+
+def test_first_single_valued_property_wins():
+    c = card("N:First;A;;;", "N:Second;B;;;", "BDAY:1980-01-02", "BDAY:1990-03-04")
+    assert c["n"][0] == "First"
+    assert c["bday"] == "1980-01-02"
+
+
+def test_vcard21_bare_tel_params_map_to_type():
+    c = card("TEL;CELL;WORK:0170", "TEL;type=home,voice:030")
+    assert c["tel"] == [
+        ({"TYPE": ["CELL", "WORK"]}, "0170"),
+        ({"TYPE": ["home", "voice"]}, "030"),
+    ]
+
+
+def test_vcard21_bare_tel_params_in_csv(tmp_path):
+    vcf = tmp_path / "in.vcf"
+    vcf.write_text(
+        "BEGIN:VCARD\r\nVERSION:2.1\r\nN:Doe;Jane\r\n"
+        "TEL;CELL;WORK:0170\r\nTEL;WORK:030\r\nEND:VCARD\r\n",
+        encoding="utf-8",
+    )
+    out = tmp_path / "out.csv"
+    convert(vcf, out)
+
+    _, row = out.read_text(encoding="utf-8-sig").splitlines()
+    fields = row[1:-1].split('","')
+    assert len(fields) == len(CSV_HEADERS)
+    assert fields[FN_MOBILE] == "0170"
+    assert fields[FN_BUSINESS] == "030"
+
+
+def test_group_prefix_is_dropped():
+    c = card("item1.TEL;TYPE=CELL:0170", "item2.EMAIL;type=INTERNET:a@b.c")
+    assert c["tel"] == [({"TYPE": ["CELL"]}, "0170")]
+    assert c["email"] == ["a@b.c"]
+
+
+def test_colon_in_quoted_param_value():
+    c = card('EMAIL;X-A="a:b":x@y', 'TEL;TYPE="cell":0170', "TITLE:a:b")
+    assert c["email"] == ["x@y"]
+    assert c["tel"] == [({"TYPE": ["cell"]}, "0170")]
+    assert c["title"] == "a:b"
+
+
+def test_lowercase_property_names():
+    c = card("n:doe;jane;;;", "bday:19800102")
+    assert c["n"][:2] == ["doe", "jane"]
+    assert c["bday"] == "19800102"
+
+
+def test_parse_date():
+    assert parse_date("1980-05-17") == date(1980, 5, 17)
+    assert parse_date("19800517") == date(1980, 5, 17)
+    assert parse_date("1980-5-17") == date(1980, 5, 17)
+    assert parse_date("1980-13-01") is None
+    assert parse_date("--0517") is None
+    assert parse_date("") is None
@@ -0,0 +1,67 @@
+import csv
+import io
+
+import pytest
+
+import vcf2exchangeCSV
+from vcf2exchangeCSV import CSV_HEADERS, FN_FIRST, FN_NOTES, convert, csv_line
+
+
+def writer_line(row):
+    f = io.StringIO()
+    csv.writer(f, quoting=csv.QUOTE_ALL).writerow(row)
+    return f.getvalue()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "plain",
+        'say "hi"',
+        '"',
+        '""',
+        "a,b",
+        '","',
+        "line\nbreak",
+        "carriage\rreturn",
+        'mixed "q", \r\n and more',
+    ],
+)
+def test_csv_line_matches_csv_writer(value):
+    row = [""] * len(CSV_HEADERS)
+    row[FN_FIRST] = value
+    row[FN_NOTES] = value + value
+    row[-1] = value
+    assert csv_line(row) + "\r\n" == writer_line(row)
+
+
+def test_csv_line_header_matches_csv_writer():
+    assert csv_line(CSV_HEADERS) + "\r\n" == writer_line(CSV_HEADERS)
+
+
+def test_flush_inside_loop_gives_same_file(tmp_path, monkeypatch):
+    vcf = tmp_path / "in.vcf"
+    vcf.write_text(
+        "".join(
+            "BEGIN:VCARD\r\n"
+            f"N:Doe {i};Jane;;;\r\n"
+            'ORG:Acme\\, "Inc";R&D\r\n'
+            f'NOTE:note "{i}"\\nsecond, line\r\n'
+            "END:VCARD\r\n"
+            for i in range(50)
+        ),
+        encoding="utf-8",
+    )
+    expected = tmp_path / "expected.csv"
+    convert(vcf, expected)
+
+    monkeypatch.setattr(vcf2exchangeCSV, "CSV_FLUSH_SIZE", 1)
+    flushed = tmp_path / "flushed.csv"
+    convert(vcf, flushed)
+
+    assert flushed.read_bytes() == expected.read_bytes()
+    with open(expected, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 51
+    assert rows[1][CSV_HEADERS.index("Company")] == 'Acme, "Inc" R&D'
@@ -0,0 +1,20 @@
+from datetime import date
+
+from vcf2ics import event_dates
+
+
+def test_event_dates():
+    assert event_dates(5, 17, 2026) == (date(2026, 5, 17), date(2026, 5, 18))
+
+
+def test_event_dates_roll_over_month_and_year():
+    assert event_dates(1, 31, 2026) == (date(2026, 1, 31), date(2026, 2, 1))
+    assert event_dates(12, 31, 2026) == (date(2026, 12, 31), date(2027, 1, 1))
+
+
+def test_event_dates_feb_29_in_non_leap_year_falls_back_to_feb_28():
+    assert event_dates(2, 29, 2027) == (date(2027, 2, 28), date(2027, 3, 1))
+
+
+def test_event_dates_feb_29_in_leap_year():
+    assert event_dates(2, 29, 2028) == (date(2028, 2, 29), date(2028, 3, 1))
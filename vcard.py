@@ -0,0 +1,179 @@
+import quopri
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+# Minimal streaming vCard reader covering only the properties the converters
+# use (N, ORG, TITLE, EMAIL, TEL, BDAY, NOTE). Each card is yielded as a dict:
+#
+#   {"n": [family, given, additional, prefix, suffix], "org": [...],
+#    "title": str, "email": [str, ...], "tel": [(params, value), ...],
+#    "bday": str, "note": str}
+#
+# Keys are only present when the card has the property. Like vobject, the
+# first occurrence wins for the single-valued properties.
+
+_ESCAPE_RE = re.compile(r"\\(.)")
+# An escape sequence or a bare field separator; matching both in one pass
+# keeps "\\;" (escaped backslash, then separator) from reading as "\;"
+_FIELD_TOKEN_RE = re.compile(r"\\(.)|;")
+_SINGLE = {"TITLE": "title", "BDAY": "bday", "NOTE": "note"}
+
+
+def _unescape_char(match) -> str:
+    c = match.group(1)
+    return "\n" if c in "nN" else c
+
+
+def _unescape(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _ESCAPE_RE.sub(_unescape_char, value)
+
+
+def _split_fields(value: str) -> list:
+    if "\\" not in value:
+        return value.split(";")
+    fields = []
+    current = []
+    pos = 0
+    for match in _FIELD_TOKEN_RE.finditer(value):
+        current.append(value[pos:match.start()])
+        if match.group(1) is None:
+            fields.append("".join(current))
+            current = []
+        else:
+            current.append(_unescape_char(match))
+        pos = match.end()
+    current.append(value[pos:])
+    fields.append("".join(current))
+    return fields
+
+
+def _value_separator(line: str) -> int:
+    # The value starts after the first colon outside a quoted parameter
+    # value, e.g. EMAIL;X-A="a:b":x@y
+    in_quotes = False
+    for i, c in enumerate(line):
+        if c == '"':
+            in_quotes = not in_quotes
+        elif c == ":" and not in_quotes:
+            return i
+    return -1
+
+
+def _parse_params(raw: str) -> dict:
+    params = {}
+    for item in raw.split(";"):
+        if not item:
+            continue
+        key, sep, values = item.partition("=")
+        if not sep:
+            # vCard 2.1 bare parameter, e.g. TEL;CELL:...
+            key, values = "TYPE", key
+        params.setdefault(key.upper(), []).extend(
+            v.strip('"') for v in values.split(",")
+        )
+    return params
+
+
+def _is_quoted_printable(line: str) -> bool:
+    return "QUOTED-PRINTABLE" in line.partition(":")[0].upper()
+
+
+def _decode_quoted_printable(value: str, params: str) -> str:
+    charset = _parse_params(params).get("CHARSET", ["utf-8"])[0]
+    raw = quopri.decodestring(value.encode("utf-8"))
+    try:
+        return raw.decode(charset, errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
+
+def _unfold(lines):
+    # RFC 6350 line folding: a line starting with whitespace continues the previous one.
+    # vCard 2.1 quoted-printable values may also end in "=" (a soft line break)
+    # and continue on the next line without leading whitespace.
+    current = None
+    soft_break = False
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if soft_break:
+            current = current[:-1] + line
+            soft_break = current.endswith("=")
+            continue
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+                soft_break = current.endswith("=") and _is_quoted_printable(current)
+            continue
+        if current is not None:
+            yield current
+        else:
+            # A UTF-8 BOM would otherwise hide the first BEGIN:VCARD
+            line = line.lstrip("\ufeff")
+        current = line
+        soft_break = line.endswith("=") and _is_quoted_printable(line)
+    if current is not None:
+        yield current
+
+
+def read_cards(lines):
+    card = None
+    for line in _unfold(lines):
+        head, sep, value = line.partition(":")
+        if '"' in head:
+            i = _value_separator(line)
+            if i < 0:
+                continue
+            head, value = line[:i], line[i + 1:]
+        elif not sep:
+            continue
+        name, _, params = head.partition(";")
+        if params and "QUOTED-PRINTABLE" in params.upper():
+            value = _decode_quoted_printable(value, params)
+        # Drop Apple-style group prefixes such as "item1.TEL"
+        name = name.rpartition(".")[2].upper()
+
+        if name == "BEGIN":
+            if value.strip().upper() == "VCARD":
+                card = {}
+            continue
+        if card is None:
+            continue
+        if name == "END":
+            if value.strip().upper() == "VCARD":
+                yield card
+                card = None
+        elif name == "TEL":
+            card.setdefault("tel", []).append((_parse_params(params), _unescape(value)))
+        elif name == "EMAIL":
+            card.setdefault("email", []).append(_unescape(value))
+        elif name == "N":
+            if "n" not in card:
+                n = _split_fields(value)
+                card["n"] = n + [""] * (5 - len(n))
+        elif name == "ORG":
+            if "org" not in card:
+                card["org"] = _split_fields(value)
+        elif name in _SINGLE:
+            card.setdefault(_SINGLE[name], _unescape(value))
+
+
+# Birthdays repeat across cards; the cache is per process and bounded
+@lru_cache(maxsize=4096)
+def parse_date(value: str):
+    # Fast path for the two formats we accept; strptime is only the fallback
+    try:
+        if len(value) == 10 and value[4] == "-" and value[7] == "-":
+            return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+        if len(value) == 8 and value.isdigit():
+            return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+    except ValueError:
+        pass
+    for fmt in ("%Y-%m-%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            pass
+    return None
@@ -1,8 +1,7 @@
-import csv
 import argparse
-import vobject
 from pathlib import Path
-from datetime import datetime
+
+from vcard import parse_date, read_cards
 
 # headers from https://support.microsoft.com/en-us/office/create-or-edit-csv-files-to-import-into-outlook-4518d70d-8fe9-46ad-94fa-1494247193c7
 
@@ -29,57 +28,102 @@ CSV_HEADERS = [  # EXACT Microsoft order
     "User 1","User 2","User 3","User 4","Web Page",
 ]
 
+IO_BUFFER_SIZE = 1 << 20
+CSV_FLUSH_SIZE = 4 << 20
 
-def outlook_date(value: str) -> str:
-    if not value:
-        return ""
-    for fmt in ("%Y-%m-%d", "%Y%m%d"):
-        try:
-            return datetime.strptime(value, fmt).strftime("%m/%d/%Y")
-        except ValueError:
-            pass
-    return ""
-
-
-def convert(vcf_path: Path, csv_path: Path) -> None:
-    with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_HEADERS, quoting=csv.QUOTE_ALL)
-        writer.writeheader()
+FIELD_INDEX = {name: i for i, name in enumerate(CSV_HEADERS)}
+_ROW_TEMPLATE = [""] * len(CSV_HEADERS)
 
-        with open(vcf_path, encoding="utf-8") as vcf:
-            for card in vobject.readComponents(vcf):
-                row = {h: "" for h in CSV_HEADERS}
+# Every field of a QUOTE_ALL row contributes exactly two quote characters
+# unless the value itself contains one
+_ROW_QUOTES = 2 * len(CSV_HEADERS)
 
-                if hasattr(card, "n"):
-                    row["First Name"] = card.n.value.given or ""
-                    row["Last Name"] = card.n.value.family or ""
+FN_FIRST = FIELD_INDEX["First Name"]
+FN_LAST = FIELD_INDEX["Last Name"]
+FN_COMPANY = FIELD_INDEX["Company"]
+FN_JOB_TITLE = FIELD_INDEX["Job Title"]
+FN_EMAIL = FIELD_INDEX["E-mail Address"]
+FN_MOBILE = FIELD_INDEX["Mobile Phone"]
+FN_BUSINESS = FIELD_INDEX["Business Phone"]
+FN_HOME = FIELD_INDEX["Home Phone"]
+FN_BIRTHDAY = FIELD_INDEX["Birthday"]
+FN_NOTES = FIELD_INDEX["Notes"]
 
-                if hasattr(card, "org"):
-                    row["Company"] = " ".join(card.org.value)
+# TEL TYPE -> column, in precedence order when a number carries several types
+TEL_MAP = {"CELL": FN_MOBILE, "WORK": FN_BUSINESS, "HOME": FN_HOME}
 
-                if hasattr(card, "title"):
-                    row["Job Title"] = card.title.value
 
-                emails = [e.value for e in getattr(card, "email_list", [])]
-                if emails:
-                    row["E-mail Address"] = emails[0]
+def outlook_date(value: str) -> str:
+    if not value:
+        return ""
+    d = parse_date(value)
+    if d is None:
+        return ""
+    return f"{d.month:02d}/{d.day:02d}/{d.year:04d}"
 
-                for tel in getattr(card, "tel_list", []):
-                    t = [x.upper() for x in tel.params.get("TYPE", [])]
-                    if "CELL" in t:
-                        row["Mobile Phone"] = tel.value
-                    elif "WORK" in t:
-                        row["Business Phone"] = tel.value
-                    elif "HOME" in t:
-                        row["Home Phone"] = tel.value
 
-                if hasattr(card, "bday"):
-                    row["Birthday"] = outlook_date(card.bday.value)
+def csv_line(row) -> str:
+    # Same output as csv.writer(quoting=csv.QUOTE_ALL), without the CRLF
+    line = '"' + '","'.join(row) + '"'
+    if line.count('"') != _ROW_QUOTES:
+        line = '"' + '","'.join([v.replace('"', '""') for v in row]) + '"'
+    return line
 
-                if hasattr(card, "note"):
-                    row["Notes"] = card.note.value.replace("\n", " ").strip()
 
-                writer.writerow(row)
+def convert(vcf_path: Path, csv_path: Path) -> None:
+    with open(
+        csv_path, "w", newline="", encoding="utf-8-sig", buffering=IO_BUFFER_SIZE
+    ) as f:
+        # Rows are joined by hand and written in chunks of roughly
+        # CSV_FLUSH_SIZE characters instead of going through the csv module
+        pending = [csv_line(CSV_HEADERS)]
+        pending_size = 0
+        with open(vcf_path, encoding="utf-8", buffering=IO_BUFFER_SIZE) as vcf:
+            for card in read_cards(vcf):
+                row = _ROW_TEMPLATE[:]
+
+                n = card.get("n")
+                if n:
+                    row[FN_FIRST] = n[1]
+                    row[FN_LAST] = n[0]
+
+                if "org" in card:
+                    row[FN_COMPANY] = " ".join(card["org"])
+
+                if "title" in card:
+                    row[FN_JOB_TITLE] = card["title"]
+
+                emails = card.get("email")
+                if emails:
+                    row[FN_EMAIL] = emails[0]
+
+                for params, value in card.get("tel", ()):
+                    types = params.get("TYPE")
+                    if not types:
+                        continue
+                    types = ",".join(types).upper().split(",")
+                    for ty, field in TEL_MAP.items():
+                        if ty in types:
+                            row[field] = value
+                            break
+
+                if "bday" in card:
+                    row[FN_BIRTHDAY] = outlook_date(card["bday"])
+
+                if "note" in card:
+                    row[FN_NOTES] = card["note"].replace("\n", " ").strip()
+
+                line = csv_line(row)
+                pending.append(line)
+                pending_size += len(line)
+                if pending_size >= CSV_FLUSH_SIZE:
+                    pending.append("")
+                    f.write("\r\n".join(pending))
+                    pending.clear()
+                    pending_size = 0
+
+        pending.append("")
+        f.write("\r\n".join(pending))
 
 
 def main():
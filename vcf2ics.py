@@ -1,33 +1,75 @@
 import argparse
 import hashlib
+import os
+import shutil
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from datetime import date, datetime, timedelta, time
-from pathlib import Path
 
-import vobject
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python 3.8, installed alongside icalendar
+    from backports.zoneinfo import ZoneInfo
+
 from icalendar import (
-    Calendar,
     Event,
     Alarm,
     Timezone,
     TimezoneStandard,
     TimezoneDaylight,
+    vDDDTypes,
+    vRecur,
+    vText,
 )
 
-TZID = "Europe/Berlin"
+from vcard import parse_date, read_cards
 
+TZID = "Europe/Berlin"
+IO_BUFFER_SIZE = 1 << 20
 
-def parse_birthday(value: str):
-    for fmt in ("%Y-%m-%d", "%Y%m%d"):
-        try:
-            return datetime.strptime(value, fmt).date()
-        except ValueError:
-            pass
-    return None
+CALENDAR_HEADER = (
+    b"BEGIN:VCALENDAR\r\n"
+    b"VERSION:2.0\r\n"
+    b"PRODID:-//VCF Birthday Calendar//EN\r\n"
+)
+CALENDAR_FOOTER = b"END:VCALENDAR\r\n"
+
+
+# Birthdays share a handful of (month, day) pairs; build each RRULE value once.
+# The returned vRecur is shared by every event with that date, so callers must
+# never mutate it (or event["RRULE"]) in place.
+@lru_cache(maxsize=None)
+def rrule_for(month: int, day: int) -> vRecur:
+    return vRecur(
+        {
+            "freq": "yearly",
+            "interval": 1,
+            "bymonth": month,
+            "bymonthday": day,
+        }
+    )
 
 
-def make_uid(name: str, birthday: date) -> str:
-    base = f"{name}-{birthday.isoformat()}"
+# Start and end (exclusive) of the all-day event in the given year; the end
+# date comes from timedelta so month and year boundaries roll over
+@lru_cache(maxsize=512)
+def event_dates(month: int, day: int, year: int) -> tuple:
+    try:
+        start = date(year, month, day)
+    except ValueError:
+        # Feb 29 birthday in a non-leap year: celebrate on Feb 28. DTSTART then
+        # falls outside the RRULE's BYMONTHDAY=29, which RFC 5545 leaves
+        # undefined; this is deliberate so the event still shows up this year
+        start = date(year, month, day - 1)
+    return start, start + timedelta(days=1)
+
+
+def make_uid(name: str, iso_birthday: str) -> str:
+    base = f"{name}-{iso_birthday}"
+    # Keep SHA-1: the UID must stay identical across runs so re-importing the
+    # calendar updates existing events instead of duplicating them
     digest = hashlib.sha1(base.encode("utf-8")).hexdigest()
     return f"birthday-{digest}@local"
 
@@ -53,6 +95,80 @@ def berlin_timezone():
     return tz
 
 
+def extract_birthdays(vcf_file) -> list:
+    birthdays = []
+    with open(vcf_file, encoding="utf-8", buffering=IO_BUFFER_SIZE) as f:
+        for card in read_cards(f):
+            if "bday" not in card:
+                continue
+
+            birthday = parse_date(card["bday"])
+            if not birthday:
+                continue
+
+            n = card.get("n")
+            name = (n[1] + " " + n[0]).strip() if n else ""
+            name = name or "Unknown"
+
+            birthdays.append((name, birthday))
+    return birthdays
+
+
+def iter_birthdays(vcf_files):
+    if len(vcf_files) == 1:
+        yield from extract_birthdays(vcf_files[0])
+        return
+
+    # Parsing is pure Python, so spread several input files across cores;
+    # map() keeps the results in input order
+    with ProcessPoolExecutor() as executor:
+        for birthdays in executor.map(extract_birthdays, vcf_files):
+            yield from birthdays
+
+
+def write_calendar(out, vcf_files, reminder_hour: int, reminder_minute: int) -> None:
+    # Events are written one at a time; the calendar is never held in memory
+    out.write(CALENDAR_HEADER)
+
+    # Add explicit Berlin timezone
+    out.write(berlin_timezone().to_ical())
+
+    today = date.today()
+    reminder_time = time(reminder_hour, reminder_minute)
+    tz = ZoneInfo(TZID)
+
+    for name, birthday in iter_birthdays(vcf_files):
+        event_date, event_end = event_dates(birthday.month, birthday.day, today.year)
+
+        iso = birthday.isoformat()
+
+        # Values are assigned as ready-made property types; Component.add()
+        # would re-infer the type of every value
+        event = Event()
+        event["UID"] = vText(make_uid(name, iso))
+        event["SUMMARY"] = vText("Geburtstag: " + name)
+        event["DESCRIPTION"] = vText("Gebrutstag von " + name + " am " + iso)
+
+        # All-day event (DATE, not DATE-TIME)
+        event["DTSTART"] = vDDDTypes(event_date)
+        event["DTEND"] = vDDDTypes(event_end)
+
+        # Yearly recurrence
+        event["RRULE"] = rrule_for(birthday.month, birthday.day)
+
+        # Alarm at local time with TZID
+        alarm = Alarm()
+        alarm["ACTION"] = vText("DISPLAY")
+        alarm["TRIGGER"] = vDDDTypes(
+            datetime.combine(event_date, reminder_time, tzinfo=tz)
+        )
+
+        event.add_component(alarm)
+        out.write(event.to_ical())
+
+    out.write(CALENDAR_FOOTER)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Create an Outlook-compatible birthday calendar (ICS) from VCF files."
@@ -68,78 +184,37 @@ def main():
     args = parser.parse_args()
     reminder_hour, reminder_minute = map(int, args.reminder_time.split(":"))
 
-    cal = Calendar()
-    cal.add("prodid", "-//VCF Birthday Calendar//EN")
-    cal.add("version", "2.0")
-
-    # Add explicit Berlin timezone
-    cal.add_component(berlin_timezone())
-
-    today = date.today()
-
-    for vcf_file in args.input:
-        with open(vcf_file, encoding="utf-8") as f:
-            for card in vobject.readComponents(f):
-                if not hasattr(card, "bday"):
-                    continue
-
-                birthday = parse_birthday(card.bday.value)
-                if not birthday:
-                    continue
-
-                name = " ".join(
-                    filter(
-                        None,
-                        [
-                            getattr(card.n.value, "given", ""),
-                            getattr(card.n.value, "family", ""),
-                        ],
-                    )
-                ) or "Unknown"
-
-                event_date = birthday.replace(year=today.year)
-
-                event = Event()
-                event.add("uid", make_uid(name, birthday))
-                event.add("summary", f"Geburtstag: {name}")
-                event.add("description", f"Gebrutstag von {name} am {birthday.isoformat()}")
-
-                # All-day event (DATE, not DATE-TIME)
-                event.add("dtstart", event_date)
-                event.add("dtend", event_date + timedelta(days=1))
-
-                # Yearly recurrence
-                event.add(
-                "rrule",
-                    {
-                        "freq": "yearly",
-                        "interval": 1,
-                        "bymonth": birthday.month,
-                        "bymonthday": birthday.day,
-                    },
-                )
-
-                # Alarm at local time with TZID
-                alarm = Alarm()
-                alarm.add("action", "DISPLAY")
-
-                trigger_dt = datetime.combine(
-                    event_date,
-                    time(reminder_hour, reminder_minute),
-                )
-                alarm.add("trigger", trigger_dt)
-                alarm["trigger"].params["TZID"] = TZID
-
-                event.add_component(alarm)
-                cal.add_component(event)
-
-    ics_bytes = cal.to_ical()
-
     if args.output:
-        Path(args.output).write_bytes(ics_bytes)
+        # Stream into a temporary file next to the target and only move it
+        # into place once the calendar is complete, so a failed run never
+        # clobbers an existing file or leaves a truncated one behind.
+        # Resolve symlinks so the link itself survives the replace.
+        target = os.path.realpath(args.output)
+        tmp = tempfile.NamedTemporaryFile(
+            "wb",
+            buffering=IO_BUFFER_SIZE,
+            dir=os.path.dirname(target),
+            suffix=".tmp",
+            delete=False,
+        )
+        try:
+            with tmp:
+                write_calendar(tmp, args.input, reminder_hour, reminder_minute)
+            # NamedTemporaryFile creates the file with mode 0600; keep the
+            # mode of the file being replaced, or the umask default for a new one
+            if os.path.exists(target):
+                shutil.copymode(target, tmp.name)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp.name, 0o666 & ~umask)
+            os.replace(tmp.name, target)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
         print(f"Birthday calendar written to {args.output}", file=sys.stderr)
     else:
-        sys.stdout.buffer.write(ics_bytes)
+        write_calendar(sys.stdout.buffer, args.input, reminder_hour, reminder_minute)
 
 
 if __name__ == "__main__":